@@ -0,0 +1,110 @@
+"""
+Offline INT8 quantization of the YOLO model for CPU inference.
+
+Exports the .pt model to OpenVINO with post-training INT8 quantization
+(via NNCF), using frames sampled from a representative race video as the
+calibration set. The result is stored next to the source model as
+``<model>_int8_openvino_model/`` and picked up at runtime when
+``config.QUANTIZE`` is enabled (env var YOLO_INT8=1).
+
+Usage:
+    python scripts/quantize.py --video path/to/race_footage.mp4
+    python scripts/quantize.py --data calib.yaml
+"""
+import argparse
+import os
+import sys
+
+import cv2
+import yaml
+from ultralytics import YOLO
+
+# Ensure src is importable when run from the repo root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import config, logger
+
+CALIB_DIR = "calibration_frames"
+CALIB_YAML = "calib.yaml"
+NUM_CALIB_FRAMES = 200
+
+
+def extract_calibration_frames(video_path: str, out_dir: str, count: int) -> int:
+    """
+    Samples `count` frames evenly from the video and writes them as JPEGs.
+
+    Args:
+        video_path (str): Source race video.
+        out_dir (str): Directory to write frames into.
+        count (int): Number of frames to sample.
+
+    Returns:
+        int: Number of frames actually written.
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        logger.error(f"Could not open calibration video: {video_path}")
+        return 0
+
+    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or count
+    step = max(1, total // count)
+    os.makedirs(out_dir, exist_ok=True)
+
+    written = 0
+    idx = 0
+    while written < count:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        if idx % step == 0:
+            cv2.imwrite(os.path.join(out_dir, f"calib_{written:04d}.jpg"), frame)
+            written += 1
+        idx += 1
+
+    cap.release()
+    logger.info(f"Wrote {written} calibration frames to {out_dir}")
+    return written
+
+
+def write_calib_yaml(frames_dir: str, path: str) -> str:
+    """Writes a minimal Ultralytics dataset yaml pointing at the calibration frames."""
+    data = {
+        "path": os.path.abspath(frames_dir),
+        "train": ".",
+        "val": ".",
+        "names": {0: "blue-car", 1: "green-car"},
+    }
+    with open(path, "w") as f:
+        yaml.safe_dump(data, f)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="INT8-quantize the YOLO model for OpenVINO")
+    parser.add_argument("--model", "-m", type=str, default=config.MODEL_PATH,
+                        help="Path to the .pt model to quantize")
+    parser.add_argument("--video", "-v", type=str,
+                        help="Race video to sample calibration frames from")
+    parser.add_argument("--data", "-d", type=str,
+                        help="Existing calibration dataset yaml (skips frame extraction)")
+    args = parser.parse_args()
+
+    data_yaml = args.data
+    if not data_yaml:
+        if not args.video:
+            parser.error("Provide --video to sample calibration frames, or --data with an existing yaml")
+        if extract_calibration_frames(args.video, CALIB_DIR, NUM_CALIB_FRAMES) == 0:
+            sys.exit(1)
+        data_yaml = write_calib_yaml(CALIB_DIR, CALIB_YAML)
+
+    logger.info(f"Quantizing {args.model} to INT8 OpenVINO (calibration: {data_yaml})...")
+    model = YOLO(args.model)
+    exported = model.export(format="openvino", int8=True, data=data_yaml)
+
+    # Ultralytics writes <model>_int8_openvino_model/ next to the .pt
+    logger.info(f"INT8 model exported to {exported}")
+    logger.info("Run with YOLO_BACKEND=openvino YOLO_INT8=1 to use it.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,200 @@
 import time
-from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
 import cv2
+import numpy as np
 from .config import logger, config
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to pure Python
+    njit = None
+
 def now() -> float:
     return time.time()
 
+def _segments_cross(ax: int, ay: int, bx: int, by: int,
+                    cx: int, cy: int, dx: int, dy: int) -> bool:
+    """
+    Returns True if segment AB intersects segment CD.
+
+    Standard counter-clockwise orientation test, inlined on scalar coords so
+    numba can compile it to straight-line integer math (called once per car
+    per frame from FinishLine.crossed).
+    """
+    acd = (dy - ay) * (cx - ax) > (cy - ay) * (dx - ax)
+    bcd = (dy - by) * (cx - bx) > (cy - by) * (dx - bx)
+    abc = (cy - ay) * (bx - ax) > (by - ay) * (cx - ax)
+    abd = (dy - ay) * (bx - ax) > (by - ay) * (dx - ax)
+    return acd != bcd and abc != abd
+
+if njit is not None:
+    _segments_cross = njit(cache=True, fastmath=True)(_segments_cross)
+    # Warm the JIT at import time so the first real crossing check is fast
+    _segments_cross(0, 0, 1, 1, 0, 1, 1, 0)
+
+class PositionHistory:
+    """
+    Fixed-size ring buffer of (x, y) positions backed by a preallocated
+    int32 NumPy array.
+
+    Drop-in replacement for the deque previously used as Car.history:
+    appends overwrite in place (no per-frame tuple/node allocation) and
+    negative indexing returns the most recent points.
+    """
+    __slots__ = ("_buf", "_idx", "_len")
+
+    def __init__(self, maxlen: int = 50):
+        self._buf = np.empty((maxlen, 2), dtype=np.int32)
+        self._idx = 0   # Next write position
+        self._len = 0   # Number of valid entries (saturates at maxlen)
+
+    def append(self, pos: Tuple[int, int]):
+        self._buf[self._idx] = pos
+        self._idx = (self._idx + 1) % len(self._buf)
+        self._len = min(self._len + 1, len(self._buf))
+
+    def clear(self):
+        self._idx = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> Tuple[int, int]:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("history index out of range")
+        j = (self._idx - self._len + i) % len(self._buf)
+        return (int(self._buf[j, 0]), int(self._buf[j, 1]))
+
+class LapLog:
+    """
+    Append-only log of per-lap values (times or penalties) backed by a
+    NumPy array with amortized-doubling growth.
+
+    Behaves like the list it replaces for the call sites we have - append,
+    len(), truthiness, slicing and iteration - while .values exposes the
+    recorded data as an array for vectorized export and analytics.
+    """
+    __slots__ = ("_buf", "_n")
+
+    def __init__(self, capacity: int = 16):
+        self._buf = np.empty(capacity)
+        self._n = 0
+
+    def append(self, value: float):
+        if self._n == len(self._buf):
+            grown = np.empty(len(self._buf) * 2)
+            grown[:self._n] = self._buf[:self._n]
+            self._buf = grown
+        self._buf[self._n] = value
+        self._n += 1
+
+    def clear(self):
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i):
+        # Delegating to the array view gives ints and slices for free
+        return self.values[i]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view of the recorded values (length len(self))."""
+        return self._buf[:self._n]
+
+class TimingBoard:
+    """
+    Struct-of-arrays storage for the per-car timing state the HUD reads
+    every frame (last seen, last crossing, penalty, flash deadline, best lap).
+
+    Cars sharing one board keep these fields in parallel NumPy arrays indexed
+    by car id, so per-frame checks like "is the car active" or "is the
+    penalty flash on" become a single vector comparison across all cars
+    instead of scattered attribute reads over the object graph.
+
+    Sentinels: last_cross < 0 means "never crossed the line" and
+    best_lap == inf means "no completed lap yet".
+    """
+    def __init__(self, n_cars: int = 1):
+        self.last_seen = np.zeros(n_cars)
+        self.last_cross = np.full(n_cars, -1.0)
+        self.penalty = np.zeros(n_cars)
+        self.flash_until = np.zeros(n_cars)
+        self.best_lap = np.full(n_cars, np.inf)
+
 @dataclass
 class Car:
     """
     Represents a single RC car in the race.
-    
+
     Tracks the car's state including position history, lap times, penalties,
-    and visual properties like name and color.
+    and visual properties like name and color. Timing state lives in a
+    TimingBoard slot (shared across cars by RaceManager); the attributes
+    below are exposed as properties viewing that slot, so callers read and
+    write them exactly as before.
     """
     name: str
     color: Tuple[int, int, int]
     position: Optional[Tuple[int, int]] = None
-    last_seen: float = 0
-    history: deque = field(default_factory=lambda: deque(maxlen=50))
+    history: PositionHistory = field(default_factory=PositionHistory)
+
+    lap_times: LapLog = field(default_factory=LapLog)
+    lap_penalties: LapLog = field(default_factory=LapLog)
+
+    # Timing slot: a standalone Car gets its own single-slot board, so it
+    # behaves identically outside a RaceManager
+    board: TimingBoard = field(default_factory=TimingBoard)
+    idx: int = 0
+
+    @property
+    def last_seen(self) -> float:
+        return float(self.board.last_seen[self.idx])
+
+    @last_seen.setter
+    def last_seen(self, t: float):
+        self.board.last_seen[self.idx] = t
+
+    @property
+    def last_cross_time(self) -> Optional[float]:
+        t = self.board.last_cross[self.idx]
+        return float(t) if t >= 0 else None
 
-    lap_times: List[float] = field(default_factory=list)
-    lap_penalties: List[float] = field(default_factory=list)
+    @last_cross_time.setter
+    def last_cross_time(self, t: Optional[float]):
+        self.board.last_cross[self.idx] = -1.0 if t is None else t
 
-    last_cross_time: Optional[float] = None
-    best_lap: Optional[float] = None
+    @property
+    def best_lap(self) -> Optional[float]:
+        t = self.board.best_lap[self.idx]
+        return float(t) if np.isfinite(t) else None
 
-    current_penalty: float = 0.0
-    penalty_flash_until: float = 0.0
+    @best_lap.setter
+    def best_lap(self, t: Optional[float]):
+        self.board.best_lap[self.idx] = np.inf if t is None else t
+
+    @property
+    def current_penalty(self) -> float:
+        return float(self.board.penalty[self.idx])
+
+    @current_penalty.setter
+    def current_penalty(self, seconds: float):
+        self.board.penalty[self.idx] = seconds
+
+    @property
+    def penalty_flash_until(self) -> float:
+        return float(self.board.flash_until[self.idx])
+
+    @penalty_flash_until.setter
+    def penalty_flash_until(self, t: float):
+        self.board.flash_until[self.idx] = t
 
     def add_penalty(self, seconds: float = 1.0):
         """
@@ -58,23 +223,26 @@ class Car:
         self.penalty_flash_until = 0.0
         logger.info(f"🔄 {self.name} RESET")
 
-    def update(self, pos: Tuple[int, int], finish_line: 'FinishLine'):
+    def update(self, pos: Tuple[int, int], finish_line: 'FinishLine', t_now: Optional[float] = None):
         """
         Updates the car's position and checks for finish line crossing.
-        
+
         Args:
             pos (Tuple[int, int]): The current (x, y) centroid of the car.
             finish_line (FinishLine): The finish line object to check against.
+            t_now (Optional[float]): Timestamp of the current frame. Pass the
+                value captured once per frame by the caller to avoid repeated
+                clock reads; defaults to now() when omitted.
         """
+        t = t_now if t_now is not None else now()
         self.position = pos
-        self.last_seen = now()
+        self.last_seen = t
         self.history.append(pos)
 
         # Need at least 2 points to form a line segment for intersection check
         if len(self.history) < config.MIN_HISTORY_LENGTH or not finish_line.is_ready():
             return
 
-        t = now()
         # Debounce: Prevent multiple lap detections within a short cooldown period
         if self.last_cross_time and t - self.last_cross_time < config.LAP_COOLDOWN_SECONDS:
             return
@@ -108,6 +276,14 @@ class FinishLine:
     """
     p1: Optional[Tuple[int, int]] = None
     p2: Optional[Tuple[int, int]] = None
+    # Cached axis-aligned bounding box (minx, miny, maxx, maxy) of the line,
+    # recomputed only when an endpoint changes
+    _bbox: Optional[Tuple[int, int, int, int]] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        # Covers direct construction with both endpoints (setters keep the
+        # cache fresh afterwards)
+        self._update_bbox()
 
     def is_ready(self) -> bool:
         """Returns True if the finish line is fully defined (both points set)."""
@@ -115,9 +291,19 @@ class FinishLine:
 
     def set_p1(self, point: Tuple[int, int]):
         self.p1 = point
-        
+        self._update_bbox()
+
     def set_p2(self, point: Tuple[int, int]):
         self.p2 = point
+        self._update_bbox()
+
+    def _update_bbox(self):
+        """Refreshes the cached line AABB once both endpoints are set."""
+        if self.is_ready():
+            self._bbox = (min(self.p1[0], self.p2[0]), min(self.p1[1], self.p2[1]),
+                          max(self.p1[0], self.p2[0]), max(self.p1[1], self.p2[1]))
+        else:
+            self._bbox = None
 
     def crossed(self, A: Tuple[int, int], B: Tuple[int, int]) -> bool:
         """
@@ -132,12 +318,16 @@ class FinishLine:
         """
         if not self.is_ready():
             return False
-            
-        C, D = self.p1, self.p2
 
-        def ccw(p1, p2, p3):
-            # Returns true if the points p1, p2, p3 are in counter-clockwise order
-            return (p3[1]-p1[1])*(p2[0]-p1[0]) > (p2[1]-p1[1])*(p3[0]-p1[0])
+        # Cheap AABB rejection first: on most frames the car is nowhere near
+        # the line, making this four compares and a return
+        ax, ay = A
+        bx, by = B
+        minx, miny, maxx, maxy = self._bbox
+        if (max(ax, bx) < minx or min(ax, bx) > maxx or
+                max(ay, by) < miny or min(ay, by) > maxy):
+            return False
 
-        # Standard segment intersection check using counter-clockwise logic
-        return ccw(A, C, D) != ccw(B, C, D) and ccw(A, B, C) != ccw(A, B, D)
+        # Delegates to the (optionally numba-compiled) scalar intersection test
+        return _segments_cross(ax, ay, bx, by,
+                               self.p1[0], self.p1[1], self.p2[0], self.p2[1])
@@ -1,10 +1,12 @@
 import cv2
-import csv
+import numpy as np
+import queue
+import threading
 import time
 import os
 from typing import Dict, Optional
 from .config import config, logger
-from .domain import Car, FinishLine
+from .domain import Car, FinishLine, TimingBoard
 from .detector import ObjectDetector
 from .visualizer import Visualizer
 
@@ -31,25 +33,59 @@ class RaceManager:
         self.detector = ObjectDetector()
         self.video_writer: Optional[cv2.VideoWriter] = None
         
-        # Initialize default race entrants
+        # Initialize default race entrants on one shared timing board so the
+        # HUD can check all cars' timing state with vectorized comparisons
+        self.timings = TimingBoard(2)
         self.cars: Dict[str, Car] = {
-            "blue-car": Car("Blue Car", (255, 0, 0)),
-            "green-car": Car("Green Car", (0, 255, 0)),
+            "blue-car": Car("Blue Car", (255, 0, 0), board=self.timings, idx=0),
+            "green-car": Car("Green Car", (0, 255, 0), board=self.timings, idx=1),
         }
 
         self.finish_line = FinishLine()
-        
+
+        # Pipeline plumbing: capture and inference run on worker threads,
+        # rendering/input stays on the main thread. Queues are kept small so
+        # latency doesn't build up behind a slow stage.
+        self._frame_q: "queue.Queue" = queue.Queue(maxsize=2)
+        self._result_q: "queue.Queue" = queue.Queue(maxsize=2)
+        self._stop = threading.Event()
+
+        # Recording runs on its own thread so encoding never stalls the
+        # capture/inference/render path (started only when recording is on)
+        self._write_q: "queue.Queue" = queue.Queue(maxsize=4)
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # Motion gating state (inference thread only): thumbnail of the last
+        # frame, the detections it produced, and how long we've been coasting
+        self._prev_small = None
+        self._last_detections: Dict = {}
+        self._skipped_frames = 0
+
+
         # Determine source (File vs Webcam)
         source = config.INPUT_VIDEO_PATH if config.INPUT_VIDEO_PATH else config.CAMERA_INDEX
         logger.info(f"Initializing input source: {source}")
-        
-        self.cap = cv2.VideoCapture(source)
-        
-        # Config options specific to webcams (files ignore these)
-        if config.INPUT_VIDEO_PATH is None:
+
+        if config.INPUT_VIDEO_PATH:
+            # Video file: use the FFMPEG backend and request hardware decode
+            # (CUVID/QSV/VAAPI, whatever the box has). VIDEO_ACCELERATION_ANY
+            # silently falls back to CPU decode when no accelerator exists,
+            # but re-open without hints in case an old OpenCV rejects them
+            self.cap = cv2.VideoCapture(source, cv2.CAP_FFMPEG,
+                                        [cv2.CAP_PROP_HW_ACCELERATION,
+                                         cv2.VIDEO_ACCELERATION_ANY])
+            if not self.cap.isOpened():
+                logger.warning("Hardware-decode open failed, retrying with defaults")
+                self.cap = cv2.VideoCapture(source)
+        else:
+            self.cap = cv2.VideoCapture(source)
+            # Config options specific to webcams (files ignore these)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.CAMERA_WIDTH)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAMERA_HEIGHT)
-        
+            # Ask the camera for MJPG: most webcams deliver it at much higher
+            # FPS than raw YUY2 at the same resolution
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
         if not self.cap.isOpened():
             logger.error(f"Could not open input source: {source}")
             raise RuntimeError("Input setup failed - Check camera connection or file path")
@@ -86,16 +122,21 @@ class RaceManager:
         """Exports lap data for all cars to individual CSV files."""
         ts = time.strftime("%Y%m%d_%H%M%S")
         for car in self.cars.values():
-            if not car.lap_times:
+            n = len(car.lap_times)
+            if n == 0:
                 continue
-                
+
             fname = f"{car.name.replace(' ', '_')}_{ts}.csv"
             try:
-                with open(fname, "w", newline="") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["Lap", "Time", "Penalty"])
-                    for i, (t, p) in enumerate(zip(car.lap_times, car.lap_penalties), 1):
-                        writer.writerow([i, f"{t:.2f}", f"{p:.1f}"])
+                # Vectorized dump: one column_stack + savetxt instead of a
+                # Python loop formatting each row
+                rows = np.column_stack([
+                    np.arange(1, n + 1),
+                    car.lap_times.values,
+                    car.lap_penalties.values,
+                ])
+                np.savetxt(fname, rows, fmt=["%d", "%.2f", "%.1f"],
+                           delimiter=",", header="Lap,Time,Penalty", comments="")
                 logger.info(f"📁 Saved {fname}")
             except IOError as e:
                 logger.error(f"Failed to write CSV {fname}: {e}")
@@ -123,8 +164,8 @@ class RaceManager:
             logger.error("Could not read frame for setup")
             return
 
-        frame = cv2.resize(frame, (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT))
-        
+        frame = self._fit_display(frame)
+
         logger.info("Waiting for user to draw finish line. Press SPACE to confirm and start.")
         while True:
             display_frame = frame.copy()
@@ -148,10 +189,199 @@ class RaceManager:
         if config.INPUT_VIDEO_PATH:
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
 
+    def _open_writer(self) -> Optional[cv2.VideoWriter]:
+        """
+        Opens the output video writer, preferring H.264 with hardware encoding.
+
+        Tries the FFMPEG backend with VIDEO_ACCELERATION_ANY first, which maps
+        onto NVENC/QSV/VAAPI when present and keeps encoding off the CPU that
+        detection needs. Falls back to software H.264 and finally the old mp4v
+        path, so recording still works on any machine.
+
+        Returns:
+            Optional[cv2.VideoWriter]: An opened writer, or None if all
+            attempts failed.
+        """
+        size = (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT)
+        attempts = [
+            ("H.264 hardware", lambda: cv2.VideoWriter(
+                config.OUTPUT_VIDEO_PATH, cv2.CAP_FFMPEG,
+                cv2.VideoWriter_fourcc(*'avc1'), config.FPS, size,
+                [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])),
+            ("H.264 software", lambda: cv2.VideoWriter(
+                config.OUTPUT_VIDEO_PATH, cv2.CAP_FFMPEG,
+                cv2.VideoWriter_fourcc(*'avc1'), config.FPS, size)),
+            ("mp4v fallback", lambda: cv2.VideoWriter(
+                config.OUTPUT_VIDEO_PATH, cv2.VideoWriter_fourcc(*'mp4v'),
+                config.FPS, size)),
+        ]
+
+        for label, open_writer in attempts:
+            try:
+                writer = open_writer()
+            except Exception as e:
+                logger.warning(f"Video writer ({label}) raised: {e}")
+                continue
+            if writer.isOpened():
+                logger.info(f"Recording to {config.OUTPUT_VIDEO_PATH} [{label}]")
+                return writer
+            writer.release()
+            logger.warning(f"Video writer ({label}) failed to open, trying next")
+
+        logger.error("Failed to open video writer.")
+        return None
+
+    def _writer_loop(self):
+        """
+        Encoder stage (worker thread).
+        Drains queued frames into the video writer; a None sentinel stops it.
+        """
+        while True:
+            frame = self._write_q.get()
+            if frame is None:
+                break
+            try:
+                self.video_writer.write(frame)
+            except Exception as e:
+                logger.error(f"Video write failed: {e}")
+                break
+
+    @staticmethod
+    def _fit_display(frame):
+        """
+        Resizes a frame to the configured display size.
+
+        Skips the (bandwidth-heavy) resize entirely when the source already
+        matches, and picks INTER_AREA for downscaling / INTER_LINEAR for
+        upscaling for the best quality-per-cost in each direction.
+        """
+        h, w = frame.shape[:2]
+        if (w, h) == (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT):
+            return frame
+        interp = cv2.INTER_AREA if w > config.DISPLAY_WIDTH else cv2.INTER_LINEAR
+        return cv2.resize(frame, (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT),
+                          interpolation=interp)
+
+    def _capture_loop(self):
+        """
+        Capture stage (worker thread).
+        Reads and resizes frames, feeding the bounded frame queue.
+        In live-camera mode the oldest queued frame is dropped on overflow so
+        the pipeline always works on fresh frames; in video-file mode capture
+        blocks instead, so no frame is ever skipped.
+        """
+        live = config.INPUT_VIDEO_PATH is None
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            frame = self._fit_display(frame)
+
+            if live:
+                while not self._stop.is_set():
+                    try:
+                        self._frame_q.put_nowait(frame)
+                        break
+                    except queue.Full:
+                        try:
+                            self._frame_q.get_nowait()
+                        except queue.Empty:
+                            pass
+            else:
+                while not self._stop.is_set():
+                    try:
+                        self._frame_q.put(frame, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+
+        # Sentinel: tells the inference stage the stream is finished
+        self._frame_q.put(None)
+
+    def _scene_changed(self, frame) -> bool:
+        """
+        Cheap motion gate for the inference stage.
+
+        Compares a 160x90 grayscale thumbnail against the previous frame's;
+        if the scene is essentially static (e.g. webcam on an empty track
+        between passes) the expensive YOLO call can be skipped and the last
+        detections reused. A full detection is forced at least every
+        config.MOTION_MAX_SKIP frames so a crossing can never be missed.
+
+        Returns:
+            bool: True if detection should run on this frame.
+        """
+        if config.MOTION_THRESHOLD <= 0:
+            return True
+
+        small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (160, 90))
+        prev = self._prev_small
+        self._prev_small = small
+
+        if prev is None:
+            return True
+        if self._skipped_frames >= config.MOTION_MAX_SKIP:
+            return True
+
+        return int(cv2.absdiff(small, prev).sum()) >= config.MOTION_THRESHOLD
+
+    def _infer_loop(self):
+        """
+        Inference stage (worker thread).
+        Pulls frames, runs detection, and pushes (frame, detections) pairs.
+        Detection is side-effect free; all race state mutation happens on the
+        main thread alongside keyboard handling.
+        """
+        vehicle_names = list(self.cars.keys())
+        # Batch only in video-file mode: live camera stays frame-at-a-time
+        # so detection latency is not inflated by batch accumulation
+        batch_size = config.BATCH_SIZE if config.INPUT_VIDEO_PATH else 1
+
+        done = False
+        while not self._stop.is_set() and not done:
+            # Accumulate up to batch_size frames (a single frame when not batching)
+            frames = []
+            while len(frames) < batch_size:
+                frame = self._frame_q.get()
+                if frame is None:
+                    done = True
+                    break
+                frames.append(frame)
+
+            if not frames:
+                break
+
+            if len(frames) == 1:
+                if self._scene_changed(frames[0]):
+                    results = [self.detector.detect(frames[0], vehicle_names)]
+                    self._last_detections = results[0]
+                    self._skipped_frames = 0
+                else:
+                    # Static scene: reuse the previous detections for ~free
+                    results = [self._last_detections]
+                    self._skipped_frames += 1
+            else:
+                results = self.detector.detect_batch(frames, vehicle_names)
+
+            # Emit per-frame results in playback order so lap timing semantics
+            # are identical to the unbatched path
+            for frame, detections in zip(frames, results):
+                while not self._stop.is_set():
+                    try:
+                        self._result_q.put((frame, detections), timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+
+        self._result_q.put(None)
+
     def run(self):
         """
         Main Event Loop.
-        Reads frames -> DETECT -> UPDATE -> DRAW -> REPEAT
+        Capture, inference, and rendering are pipelined across threads so the
+        stages overlap instead of running strictly in sequence:
+        capture thread -> frame queue -> inference thread -> result queue ->
+        main thread (UPDATE -> DRAW -> SHOW).
         """
         window_name = "Race Content"
         cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
@@ -167,46 +397,52 @@ class RaceManager:
 
             # Setup Video Writer if requested
             if config.SAVE_OUTPUT_VIDEO:
-                try:
-                    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                    self.video_writer = cv2.VideoWriter(
-                        config.OUTPUT_VIDEO_PATH, 
-                        fourcc, 
-                        config.FPS, 
-                        (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT)
-                    )
-                    if not self.video_writer.isOpened():
-                         logger.error("Failed to open video writer.")
-                    else:
-                         logger.info(f"Recording to {config.OUTPUT_VIDEO_PATH}")
-                except Exception as e:
-                    logger.error(f"Video writer setup failed: {e}")
+                self.video_writer = self._open_writer()
+                if self.video_writer:
+                    self._writer_thread = threading.Thread(
+                        target=self._writer_loop, daemon=True)
+                    self._writer_thread.start()
 
             logger.info("Starting race loop. Press 'q' to quit.")
-            
+
+            capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            infer_thread = threading.Thread(target=self._infer_loop, daemon=True)
+            capture_thread.start()
+            infer_thread.start()
+
             while True:
-                ret, frame = self.cap.read()
-                if not ret:
+                try:
+                    item = self._result_q.get(timeout=0.5)
+                except queue.Empty:
+                    # Keep the UI responsive while the pipeline warms up
+                    if self.handle_keypress(cv2.waitKey(1) & 0xFF):
+                        break
+                    continue
+
+                if item is None:
                     logger.warning("End of stream or failed to read")
                     break
 
-                # Resize to standard display size for consistency
-                frame = cv2.resize(frame, (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT))
+                frame, detections = item
 
-                # 1. Detect Objects
-                detections = self.detector.detect(frame, list(self.cars.keys()))
+                # Single clock read per frame, shared by state updates and HUD
+                t_now = time.time()
 
                 # 2. Update Game State
                 for name, (cx, cy, conf, box) in detections.items():
-                    self.cars[name].update((cx, cy), self.finish_line)
+                    self.cars[name].update((cx, cy), self.finish_line, t_now)
 
                 # 3. Visualize
                 Visualizer.draw_car_boxes(frame, self.cars, detections)
-                Visualizer.draw_hud(frame, self.cars, self.finish_line)
+                Visualizer.draw_hud(frame, self.cars, self.finish_line, t_now)
                 
-                # 4. Record Frame (if active)
-                if self.video_writer and self.video_writer.isOpened():
-                    self.video_writer.write(frame)
+                # 4. Record Frame (if active): hand off to the encoder thread,
+                # dropping the frame rather than stalling if encoding lags
+                if self._writer_thread:
+                    try:
+                        self._write_q.put_nowait(frame.copy())
+                    except queue.Full:
+                        pass
 
                 cv2.imshow(window_name, frame)
 
@@ -220,6 +456,14 @@ class RaceManager:
             logger.error(f"Unexpected critical error during run loop: {e}", exc_info=True)
         finally:
             # Cleanup resources securely
+            self._stop.set()
+            if self._writer_thread:
+                # Let the encoder finish queued frames, then stop it
+                try:
+                    self._write_q.put(None, timeout=1.0)
+                except queue.Full:
+                    pass
+                self._writer_thread.join(timeout=5.0)
             if self.cap: self.cap.release()
             if self.video_writer: self.video_writer.release()
             cv2.destroyAllWindows()
@@ -1,6 +1,7 @@
 import cv2
 import time
-from typing import Dict
+import numpy as np
+from typing import Dict, Tuple
 from .domain import Car, FinishLine, now
 from .config import config
 
@@ -8,7 +9,77 @@ class Visualizer:
     """
     Static utility class for drawing UI elements, HUDs, and boxes on frames.
     """
-    
+
+    # Pre-rendered static HUD text (title strip, controls footer strip),
+    # cached per frame size so glyphs are rasterized once, not every frame
+    _static_cache: Dict[Tuple[int, int], tuple] = {}
+
+    CONTROLS_TEXT = "[B] Blue +2s | [G] Green +2s | [R] Reset | [E] Export | [Q] Quit"
+
+    # Measured label sizes, keyed by label string. Labels repeat almost
+    # verbatim frame to frame (only the confidence digits change), so this
+    # caps glyph measurement at a handful of distinct strings
+    _text_size_cache: Dict[str, Tuple[int, int]] = {}
+
+    # Pre-rendered HUD row prefixes ("{name} | Curr " with shadow baked in),
+    # keyed by (name, color). Each car only ever uses three colors (own,
+    # greyed-out, penalty red), so the cache stays tiny
+    _hud_prefix_cache: Dict[tuple, tuple] = {}
+
+    @classmethod
+    def _hud_prefix(cls, name: str, color: Tuple[int, int, int]):
+        """
+        Lazily renders the static prefix of a HUD row in the given color.
+
+        Returns (strip, mask, prefix_width): a small BGR strip with the
+        shadow+main text baked in (baseline at row 22), a boolean mask of the
+        text pixels, and the x-advance at which the dynamic tail starts.
+        """
+        key = (name, color)
+        cached = cls._hud_prefix_cache.get(key)
+        if cached is None:
+            text = f"{name} | Curr "
+            (tw, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+
+            # Mask covers both the shadow and main passes; the strip itself
+            # stays black under the shadow pixels, matching the old look
+            mask = np.zeros((34, tw + 4), dtype=np.uint8)
+            cv2.putText(mask, text, (2, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+            cv2.putText(mask, text, (0, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+
+            strip = np.zeros((34, tw + 4, 3), dtype=np.uint8)
+            cv2.putText(strip, text, (0, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+
+            cached = (strip, (mask > 0)[..., None], tw)
+            cls._hud_prefix_cache[key] = cached
+        return cached
+
+    @classmethod
+    def _static_chrome(cls, w: int, h: int):
+        """
+        Lazily renders the static HUD chrome for a given frame size.
+
+        Returns (title_strip, title_mask, footer_strip, footer_mask), where
+        each strip is a BGR image covering the top/bottom band of the frame
+        and the mask marks the text pixels to copy. Rendering happens once
+        per frame size; every later frame just blits the cached pixels.
+        """
+        key = (w, h)
+        cached = cls._static_cache.get(key)
+        if cached is None:
+            title = np.zeros((45, w, 3), dtype=np.uint8)
+            cv2.putText(title, "RACE CONTROL",
+                        (20, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255,255,255), 2)
+
+            footer = np.zeros((40, w, 3), dtype=np.uint8)
+            cv2.putText(footer, cls.CONTROLS_TEXT, (20, 20),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+
+            cached = (title, title.max(axis=2, keepdims=True) > 0,
+                      footer, footer.max(axis=2, keepdims=True) > 0)
+            cls._static_cache[key] = cached
+        return cached
+
     @staticmethod
     def draw_finish_line(frame, finish_line: FinishLine):
         """
@@ -47,7 +118,11 @@ class Visualizer:
             
             # Draw label background for specific readability
             label = f"{car.name} {conf:.2f}"
-            (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+            size = Visualizer._text_size_cache.get(label)
+            if size is None:
+                size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+                Visualizer._text_size_cache[label] = size
+            w = size[0]
             cv2.rectangle(frame, (x1, y1 - 20), (x1 + w, y1), car.color, -1)
             
             # Draw text
@@ -55,34 +130,51 @@ class Visualizer:
                         (x1, y1-5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
 
     @staticmethod
-    def draw_hud(frame, cars: Dict[str, Car], finish_line: FinishLine):
+    def draw_hud(frame, cars: Dict[str, Car], finish_line: FinishLine, t_now: float = None):
         """
         Draws the heads-up display with timings and status.
-        
+
         Args:
             frame: OpenCV image.
             cars: Car data source.
             finish_line: Line status source.
+            t_now: Timestamp of the current frame, captured once by the caller
+                   so the HUD doesn't re-read the clock per car. Defaults to now().
         """
         if frame is None: return
 
+        if t_now is None:
+            t_now = now()
+
         Visualizer.draw_finish_line(frame, finish_line)
-        
-        # Title
-        cv2.putText(frame, "RACE CONTROL",
-                    (20, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255,255,255), 2)
+
+        # Blit the pre-rendered title and controls footer (rasterized once
+        # per frame size) instead of re-running putText every frame
+        h, w = frame.shape[:2]
+        title, title_mask, footer, footer_mask = Visualizer._static_chrome(w, h)
+        np.copyto(frame[:title.shape[0]], title, where=title_mask)
+        np.copyto(frame[h - footer.shape[0]:], footer, where=footer_mask)
+
+        # When all cars share one TimingBoard (the RaceManager default), the
+        # per-car activity and penalty-flash checks collapse into two vector
+        # comparisons; otherwise fall back to per-car attribute reads
+        board = next(iter(cars.values())).board if cars else None
+        shared = board is not None and all(c.board is board for c in cars.values())
+        if shared:
+            active_mask = (t_now - board.last_seen) < 1.0
+            flash_mask = t_now < board.flash_until
 
         y = 70
         for car in cars.values():
             # Check if car has been seen recently (1.0s threshold)
-            active = now() - car.last_seen < 1.0
+            active = bool(active_mask[car.idx]) if shared else t_now - car.last_seen < 1.0
             color = car.color if active else (120,120,120)  # Grey out if lost
 
             # Format Current Lap Time
             curr = "--"
             if car.last_cross_time:
                 # Calculate current running lap time + penalty
-                curr = f"{(now()-car.last_cross_time+car.current_penalty):.1f}s"
+                curr = f"{(t_now-car.last_cross_time+car.current_penalty):.1f}s"
 
             # Format Best Lap Time
             best = f"{car.best_lap:.2f}s" if car.best_lap else "--"
@@ -97,20 +189,22 @@ class Visualizer:
             penalty = f"+{car.current_penalty:.1f}s"
             
             # Flash RED if recent penalty applied
-            if now() < car.penalty_flash_until:
+            flashing = bool(flash_mask[car.idx]) if shared else t_now < car.penalty_flash_until
+            if flashing:
                 color = (0,0,255)
 
-            text = f"{car.name} | Curr {curr} | Best {best} | Prev [{prev_str}] | Pen {penalty}"
-            
-            # Text shadow for readability
-            cv2.putText(frame, text, (22, y+2),
+            # Static prefix comes from the pre-rendered cache; only the
+            # changing numeric tail is rasterized fresh (shadow + main)
+            strip, mask, prefix_w = Visualizer._hud_prefix(car.name, color)
+            top = y - 22
+            np.copyto(frame[top:top + strip.shape[0], 20:20 + strip.shape[1]],
+                      strip, where=mask)
+
+            tail = f"{curr} | Best {best} | Prev [{prev_str}] | Pen {penalty}"
+            tx = 20 + prefix_w
+            cv2.putText(frame, tail, (tx+2, y+2),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,0,0), 2)
-            cv2.putText(frame, text, (20, y),
+            cv2.putText(frame, tail, (tx, y),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
             y += 30
 
-        # Draw controls help footer
-        controls = "[B] Blue +2s | [G] Green +2s | [R] Reset | [E] Export | [Q] Quit"
-        h = frame.shape[0]
-        cv2.putText(frame, controls, (20, h - 20),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)